@@ -14,12 +14,16 @@ def escape_html(text):
         return ""
     return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
+_SLUG_STRIP = re.compile(r'[^a-zA-Z0-9\s-]')
+_SLUG_SPACE = re.compile(r'\s+')
+_PLACEHOLDER_TITLE = re.compile(r"(service|item|entry)\s*\d+")
+
 def slugify(text):
     """Generate URL-friendly slug from text"""
     if not text:
         return "item"
-    text = re.sub(r'[^a-zA-Z0-9\s-]', '', str(text))
-    text = re.sub(r'[\s]+', '-', text.strip().lower())
+    text = _SLUG_STRIP.sub('', str(text))
+    text = _SLUG_SPACE.sub('-', text.strip().lower())
     return text or "item"
 
 def load_data(filepath):
@@ -74,7 +78,7 @@ def _is_placeholder_title(text):
     t = text.strip().lower()
     return (
         t in {"service", "unnamed service", "untitled", "n/a", "na", "tbd"}
-        or bool(re.fullmatch(r"(service|item|entry)\s*\d+", t))
+        or bool(_PLACEHOLDER_TITLE.fullmatch(t))
     )
 
 def _guess_description(obj):
@@ -1,8 +1,24 @@
 import os
-import pandas as pd
+import functools
 import json
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Callable
+
+import openpyxl
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # optional: fall back to openpyxl
+    CalamineWorkbook = None
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to stdlib json
+    orjson = None
 
 # ============================================================
 # NO-DUPES / OVERWRITE generator
@@ -15,6 +31,11 @@ import sys
 #  --clean  -> remove previously-generated files under schemas/* for supported sections
 #             before writing new ones (helps remove orphans).
 #
+# Upgrading from the pandas-based version: run once with --clean and commit the result.
+#  - Numeric id/slug columns with blank cells used to be read as floats, so id 1 became
+#    slug "10" (from 1.0) and is now "1"; without --clean the old 10.json stays as an orphan.
+#  - Text cells that look numeric (e.g. zip "90210") are now kept as strings, not ints.
+#
 # Supports BOTH:
 #  - legacy workbook sheets: entity_info, Services, Team, Press/News Mentions, Awards & Certifications, etc.
 #  - newer/legal workbook sheets: Business Info, Practice Areas, Lawyers, Media Mentions, Awards, Certifications,
@@ -26,6 +47,11 @@ import sys
 #  - Locations: address_postal -> address_postal_code ; open_hours -> hours
 # ============================================================
 
+_SLUG_STRIP = re.compile(r"[^a-zA-Z0-9\s-]")
+_SLUG_SPACE = re.compile(r"\s+")
+
+
+@functools.lru_cache(maxsize=8192)
 def slugify(text: str) -> str:
     """Generate clean, URL-friendly slug from text"""
     if text is None:
@@ -33,21 +59,21 @@ def slugify(text: str) -> str:
     text = str(text).strip()
     if not text:
         return "untitled"
-    text = re.sub(r"[^a-zA-Z0-9\s-]", "", text)
-    text = re.sub(r"[\s]+", "-", text.strip().lower())
+    text = _SLUG_STRIP.sub("", text)
+    text = _SLUG_SPACE.sub("-", text.strip().lower())
     return text or "untitled"
 
 
 def _as_str(v):
     if v is None:
         return ""
-    if isinstance(v, float) and pd.isna(v):
+    if isinstance(v, float) and v != v:  # NaN
         return ""
     return str(v).strip()
 
 
 def _is_blank(v):
-    return v is None or (isinstance(v, float) and pd.isna(v)) or str(v).strip() == ""
+    return v is None or v == "" or (isinstance(v, float) and v != v) or str(v).strip() == ""
 
 
 def get_first(row, keys, default=""):
@@ -58,30 +84,79 @@ def get_first(row, keys, default=""):
     return default
 
 
-def normalize_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Strip whitespace from column names for stable access."""
-    df.columns = [str(c).strip() for c in df.columns]
-    return df
+def resolve_fields(columns, mapping: dict[str, list[str]]) -> dict[str, tuple[str, ...]]:
+    """
+    Resolve each logical field to the candidate columns this sheet actually has,
+    keeping priority order. Done once per sheet so the row loop never probes
+    column names that do not exist (usually leaves 0 or 1 column per field).
+    """
+    present = set(columns)
+    return {field: tuple(c for c in candidates if c in present) for field, candidates in mapping.items()}
 
 
-def deterministic_path(output_dir: str, base_slug: str, ext: str) -> str:
+def compile_extractor(fields: dict[str, tuple[str, ...]]):
+    """
+    Specialize field lookup for one sheet's resolved columns (see resolve_fields).
+    Fields with a single column become a direct key lookup and fields with none a
+    constant, so the returned extract(row) -> {field: value or ""} does no candidate
+    scanning per row; only fields with several present aliases fall back to get_first().
+    """
+    missing = {name: "" for name, cols in fields.items() if not cols}
+    single = [(name, cols[0]) for name, cols in fields.items() if len(cols) == 1]
+    multi = [(name, cols) for name, cols in fields.items() if len(cols) > 1]
+
+    def extract(row: dict) -> dict:
+        values = dict(missing)
+        for name, col in single:
+            v = row[col]
+            values[name] = "" if _is_blank(v) else v
+        for name, cols in multi:
+            values[name] = get_first(row, cols)
+        return values
+
+    return extract
+
+
+def deterministic_path(output_dir: str, base_slug: str, ext: str, *, normalize: bool = True) -> str:
     """
     Deterministic filename: <slug><ext>
     OVERWRITES if it already exists (prevents "-1" files on rerun).
+    Pass normalize=False when base_slug has been through slugify() already.
     """
-    base_slug = slugify(base_slug)
+    if normalize:
+        base_slug = slugify(base_slug)
     filename = f"{base_slug}{ext}"
     return os.path.join(output_dir, filename)
 
 
-def write_json(path: str, data: dict):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False, default=str)
-
-
-def write_md(path: str, title: str, slug: str, body: str, extra_frontmatter: dict | None = None):
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+def _dumps(data) -> bytes:
+    """
+    Indented UTF-8 JSON bytes. Uses orjson (serializer in Rust) when installed;
+    dates and other non-JSON values go through str() either way.
+    orjson and json format some floats differently (0.00001 vs 1e-05), so the
+    committed output depends on whether orjson is installed; the workflows install it.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME)
+        except TypeError:  # e.g. ints beyond 64 bits
+            pass
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode("utf-8")
+
+
+def write_json(path: str, data: dict, ensure_dir: bool = False):
+    # main() creates every output dir up front; ensure_dir is for other callers.
+    if ensure_dir:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    # Encode once and write once: json.dump() streams many tiny chunks into the file.
+    with open(path, "wb", buffering=64 * 1024) as f:
+        f.write(_dumps(data))
+
+
+def write_md(path: str, title: str, slug: str, body: str, extra_frontmatter: dict | None = None,
+             ensure_dir: bool = False):
+    if ensure_dir:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
     extra_frontmatter = extra_frontmatter or {}
     with open(path, "w", encoding="utf-8") as f:
         f.write("---\n")
@@ -96,598 +171,691 @@ def write_md(path: str, title: str, slug: str, body: str, extra_frontmatter: dic
         f.write(body or "")
 
 
-def clean_output_dirs(canonical_output: dict):
+# Strings treated as missing cells (same set as pandas' default na_values).
+_NA_STRINGS = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+})
+
+
+def _clean_cell(v):
     """
-    Removes previously-generated files in known schema output dirs.
-    Only deletes .json and .md in those folders, and leaves folders intact.
+    Normalize a raw cell value: NA strings -> None, 3.0 -> 3, date -> datetime.
+    Per cell, unlike pandas' per-column dtypes: see the upgrade note at the top.
     """
-    removed = 0
-    for _, out_dir in canonical_output.items():
-        if not os.path.isdir(out_dir):
+    if isinstance(v, str):
+        return None if v in _NA_STRINGS else v
+    if isinstance(v, float):
+        if v != v:
+            return None
+        return int(v) if v.is_integer() else v
+    if isinstance(v, date) and not isinstance(v, datetime):
+        return datetime(v.year, v.month, v.day)
+    return v
+
+
+def _rows_to_records(rows) -> tuple[list[str], list[tuple[int, dict]]]:
+    """
+    Turn raw sheet rows into (header, [(row number, record), ...]), one dict per
+    non-blank data row keyed by the first (header) row.
+    Rows are consumed as a stream and blank rows are dropped right here, while their
+    cells are being cleaned anyway, so nothing downstream re-checks for empty rows.
+    Row numbers count blank rows too, keeping "<prefix>-N" fallback slugs stable.
+    Short rows are padded, header names are stripped, blank headers become
+    "Unnamed: <i>" and repeated ones get ".1", ".2", ... suffixes.
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return [], []
+    header_row = [_clean_cell(v) for v in first]
+
+    data = []
+    for idx, r in enumerate(rows):
+        r = [_clean_cell(v) for v in r]
+        if all(v is None for v in r):
             continue
-        for fname in os.listdir(out_dir):
-            if fname.lower().endswith((".json", ".md")):
-                try:
-                    os.remove(os.path.join(out_dir, fname))
-                    removed += 1
-                except Exception:
-                    pass
-    print(f"🧽 Cleaned {removed} previously-generated file(s) under schemas/*.")
+        data.append((idx, r))
 
+    if not data and all(v is None for v in header_row):
+        return [], []
 
-def main(input_file="templates/AI-Visibility-Master-Template.xlsx", clean=False):
-    print(f"📂 Opening Excel file: {input_file}")
+    width = max((i + 1 for r in [header_row, *(r for _, r in data)] for i, v in enumerate(r) if v is not None),
+                default=0)
+    header = []
+    for i, c in enumerate((header_row + [None] * width)[:width]):
+        c = f"Unnamed: {i}" if c is None else str(c).strip()
+        name, n = c, 0
+        while name in header:
+            n += 1
+            name = f"{c}.{n}"
+        header.append(name)
+    return header, [(idx, dict(zip(header, (r + [None] * width)[:width]))) for idx, r in data]
 
-    if not os.path.exists(input_file):
-        print(f"❌ FATAL: Excel file not found at {input_file}")
-        sys.exit(1)
-    else:
-        print(f"✅ Excel file confirmed at: {input_file}")
 
-    try:
-        xlsx = pd.ExcelFile(input_file)
-        print(f"📄 Available sheets in workbook: {xlsx.sheet_names}")
-    except Exception as e:
-        print(f"❌ Failed to load Excel file: {e}")
-        sys.exit(1)
+def read_sheet_fast(wb, sheet_name: str) -> tuple[list[str], list[tuple[int, dict]]]:
+    """
+    Read one sheet of an openpyxl workbook straight into records.
+    The workbook's shared-string table is parsed once at load time, so every string
+    cell is an index into that table rather than a fresh XML lookup.
+    """
+    ws = wb[sheet_name]
+    if wb.read_only:
+        # read_only mode stops at the sheet's <dimension> tag, which some tools
+        # leave stale (e.g. "A1"); pandas' openpyxl reader resets it too.
+        ws.reset_dimensions()
+    return _rows_to_records(ws.iter_rows(values_only=True))
 
-    # Canonical sheet keys -> output dirs
-    canonical_output = {
-        "organization": "schemas/organization",
-        "services": "schemas/services",
-        "products": "schemas/products",
-        "faqs": "schemas/faqs",
-        "help_articles": "schemas/help-articles",
-        "reviews": "schemas/reviews",
-        "locations": "schemas/locations",
-        "team": "schemas/team",
-        "awards": "schemas/awards",
-        "press": "schemas/press",
-        "case_studies": "schemas/case-studies",
-    }
 
-    # Sheet aliases (supports both old and new/legal names)
-    SHEET_ALIASES = {
-        "organization": [
-            "entity_info",
-            "Business Info",
-            "Business information",
-            "Organization",
-            "Company",
-            "Firm Info",
-        ],
-        "services": [
-            "Services",
-            "Practice Areas",
-            "Practice areas",
-            "Service Areas",
-            "Medical Specialties",
-        ],
-        "products": [
-            "Products",
-        ],
-        "faqs": [
-            "FAQs",
-            "FAQ",
-        ],
-        "help_articles": [
-            "Help Articles",
-            "Help articles",
-            "Articles",
-            "Guides",
-            "Blog",
-        ],
-        "reviews": [
-            "Reviews",
-            "Testimonials",
-        ],
-        "locations": [
-            "Locations",
-            "Offices",
-        ],
-        "team": [
-            "Team",
-            "Lawyers",
-            "Attorneys",
-            "Providers",
-            "Staff",
-        ],
-        "awards": [
-            "Awards & Certifications",
-            "Awards",
-            "Certifications",
-            "Accreditations",
-            "Licenses",
-            "Awards, Certifications, Accreditations",
-        ],
-        "press": [
-            "Press/News Mentions",
-            "Media Mentions",
-            "Press",
-            "News",
-            "Media",
-        ],
-        "case_studies": [
-            "Case Studies",
-            "Case studies",
-            "Matters",
-            "Results",
-        ],
-    }
+def open_workbook(input_file: str):
+    """
+    Open the workbook with the fastest reader available.
+    Returns (sheet_names, read_sheet) where read_sheet(name) -> (header, [(row number, record), ...]).
 
-    def norm_sheet(s: str) -> str:
-        return re.sub(r"\s+", " ", str(s).strip().lower())
+      1) calamine (Rust, one pass, low memory) if python-calamine is installed
+      2) openpyxl read_only=True (streaming reader, no styles/object model)
+      3) openpyxl full load if read_only mode chokes on the file or a sheet
 
-    alias_lookup = {}
-    for canon, aliases in SHEET_ALIASES.items():
-        for a in aliases:
-            alias_lookup[norm_sheet(a)] = canon
+    Steps 2-3 are the same chain whether calamine rejected the whole workbook or
+    one sheet, and each openpyxl workbook is loaded at most once.
+    """
+    books = {}  # read_only flag -> loaded openpyxl workbook
 
-    if clean:
-        clean_output_dirs(canonical_output)
+    def full_book():
+        if False not in books:
+            books[False] = openpyxl.load_workbook(input_file, data_only=True)
+        return books[False]
 
-    processed_any = False
+    def read_only_book():
+        if True not in books:
+            try:
+                books[True] = openpyxl.load_workbook(input_file, read_only=True, data_only=True)
+            except Exception as e:
+                print(f"⚠️ openpyxl read_only failed ({e}); falling back to full workbook load")
+                books[True] = full_book()
+        return books[True]
+
+    def read_openpyxl(sheet_name: str) -> tuple[list[str], list[tuple[int, dict]]]:
+        wb = read_only_book()
+        try:
+            return read_sheet_fast(wb, sheet_name)
+        except Exception as e:
+            if not wb.read_only:
+                raise
+            print(f"⚠️ read_only read of '{sheet_name}' failed ({e}); retrying with full load")
+            return read_sheet_fast(full_book(), sheet_name)
+
+    if CalamineWorkbook is not None:
+        try:
+            cwb = CalamineWorkbook.from_path(input_file)
+        except Exception as e:
+            print(f"⚠️ calamine could not open workbook ({e}); falling back to openpyxl read_only")
+        else:
+            # calamine only parses a sheet's XML when it is read, so a bad sheet
+            # surfaces here rather than in from_path(); fall back for that sheet.
+            def read_sheet(sheet_name: str) -> tuple[list[str], list[tuple[int, dict]]]:
+                try:
+                    return _rows_to_records(cwb.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False))
+                except Exception as e:
+                    print(f"⚠️ calamine could not read '{sheet_name}' ({e}); falling back to openpyxl read_only")
+                    return read_openpyxl(sheet_name)
 
-    for actual_sheet in xlsx.sheet_names:
-        canon = alias_lookup.get(norm_sheet(actual_sheet))
-        if not canon:
-            print(f"⚠️ Skipping unsupported sheet: {actual_sheet}")
-            continue
+            return cwb.sheet_names, read_sheet
 
-        output_dir = canonical_output[canon]
-        os.makedirs(output_dir, exist_ok=True)
+    return read_only_book().sheetnames, read_openpyxl
 
-        print(f"\n📄 Processing sheet: {actual_sheet}  →  {canon}  →  {output_dir}")
 
-        df = xlsx.parse(actual_sheet)
-        df = normalize_columns(df)
+WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
-        if df.empty:
-            print(f"⚠️ Sheet '{actual_sheet}' is empty — skipping")
-            continue
 
-        print(f"🧹 Cleaned column names: {list(df.columns)}")
-
-        processed_count = 0
-        seen_slugs = set()  # prevents duplicates WITHIN the same run for a given sheet
-
-        # ----------------------------
-        # ORGANIZATION (usually 1 row)
-        # ----------------------------
-        if canon == "organization":
-            row_obj = None
-            for _, r in df.iterrows():
-                if not r.dropna().empty:
-                    row_obj = r
-                    break
-
-            if row_obj is None:
-                print("⚠️ No usable rows in organization sheet — skipping")
-            else:
-                row = row_obj
-
-                business_name = _as_str(get_first(row, ["business_name", "entity_name", "name", "company_name", "firm_name"]))
-                main_website_url = _as_str(get_first(row, ["main_website_url", "website", "url"]))
-                logo_url = _as_str(get_first(row, ["logo_url", "logo", "logoUrl"]))
-                short_description = _as_str(get_first(row, ["short_description", "description", "tagline"]))
-                long_description = _as_str(get_first(row, ["long_description", "about", "about_text"]))
-
-                same_as = []
-                for k in [
-                    "facebook_url", "instagram_url", "linkedin_url", "twitter_url", "x_url",
-                    "youtube_url", "tiktok_url", "pinterest_url", "yelp_url", "bbb_url",
-                    "avvo_url", "martindale_url", "other_profiles"
-                ]:
-                    v = get_first(row, [k])
-                    if _is_blank(v):
-                        continue
-                    vv = str(v).strip()
-                    if k == "other_profiles" and "," in vv:
-                        for part in [p.strip() for p in vv.split(",") if p.strip()]:
-                            same_as.append(part)
-                    else:
-                        same_as.append(vv)
-
-                org = {}
-                for col in df.columns:
-                    v = row.get(col)
-                    if pd.isna(v):
-                        continue
-                    if hasattr(v, "item"):
-                        v = v.item()
-                    org[col] = v
-
-                if business_name:
-                    org["entity_name"] = business_name
-                if main_website_url:
-                    org["website"] = main_website_url
-                    org["url"] = main_website_url
-                if logo_url:
-                    org["logo_url"] = logo_url
-                if short_description and "description" not in org:
-                    org["description"] = short_description
-                if long_description:
-                    org["about"] = long_description
-                if same_as:
-                    org["sameAs"] = same_as
-
-                path = os.path.join(output_dir, "organization.json")
-                try:
-                    write_json(path, org)  # overwrite
-                    print(f"✅ Generated (overwrite): {path}")
-                    processed_count += 1
-                    processed_any = True
-                except Exception as e:
-                    print(f"❌ Failed to write {path}: {e}")
+def _run_write(task):
+    _, write = task
+    try:
+        write()
+    except Exception as e:
+        return e
+    return None
 
-            print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
-            continue
 
-        # ----------------------------
-        # HELP ARTICLES → Markdown
-        # ----------------------------
-        if canon == "help_articles":
-            for idx, row in df.iterrows():
-                if row.dropna().empty:
-                    continue
+def write_files(tasks: list) -> list:
+    """
+    Run (path, write callable) tasks on a thread pool; file writes are I/O-bound and
+    every path is distinct (slugs are de-duplicated per sheet), so they can overlap.
+    Returns each task's exception (or None) in task order.
+    """
+    if not tasks:
+        return []
+    with ThreadPoolExecutor(max_workers=min(WRITE_WORKERS, len(tasks))) as ex:
+        return list(ex.map(_run_write, tasks))
 
-                title = _as_str(get_first(row, ["title", "article_title", "name", "headline"]))
-                slug = _as_str(get_first(row, ["slug", "article_slug"]))
-                body = _as_str(get_first(row, ["article_content", "article", "content", "body", "markdown"]))
 
-                if not slug:
-                    slug = slugify(title) if title else f"article-{idx+1}"
-                slug = slugify(slug)
+def clean_output_dirs(canonical_output: dict):
+    """
+    Removes previously-generated files in known schema output dirs.
+    Only deletes .json and .md in those folders, and leaves folders intact.
+    """
+    removed = 0
+    for _, out_dir in canonical_output.items():
+        if not os.path.isdir(out_dir):
+            continue
+        # scandir yields names/paths directly (no extra list or per-entry join/stat)
+        with os.scandir(out_dir) as it:
+            for entry in it:
+                if entry.name.lower().endswith((".json", ".md")):
+                    try:
+                        os.unlink(entry.path)
+                        removed += 1
+                    except Exception:
+                        pass
+    print(f"🧽 Cleaned {removed} previously-generated file(s) under schemas/*.")
 
-                if slug in seen_slugs:
-                    print(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
-                    continue
-                seen_slugs.add(slug)
 
-                path = deterministic_path(output_dir, slug, ".md")
+# ----------------------------
+# Per-sheet row builders: (row, extracted field values, row number) -> (slug, payload)
+# Each builder slugifies its slug exactly once (slugify is idempotent, so fallbacks
+# are passed through raw rather than slugified twice).
+# ----------------------------
 
-                try:
-                    write_md(
-                        path=path,
-                        title=title,
-                        slug=slug,
-                        body=body,
-                        extra_frontmatter={
-                            "date": _as_str(get_first(row, ["date", "published_date", "publish_date"]))
-                        }
-                    )
-                    print(f"✅ Generated (overwrite): {path}")
-                    processed_count += 1
-                    processed_any = True
-                except Exception as e:
-                    print(f"❌ Failed to write {path}: {e}")
+# Organization columns collected into sameAs (in this order)
+PROFILE_COLUMNS = [
+    "facebook_url", "instagram_url", "linkedin_url", "twitter_url", "x_url",
+    "youtube_url", "tiktok_url", "pinterest_url", "yelp_url", "bbb_url",
+    "avvo_url", "martindale_url", "other_profiles"
+]
 
-            print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
-            continue
 
-        # ----------------------------
-        # FAQs → JSON
-        # ----------------------------
-        if canon == "faqs":
-            for idx, row in df.iterrows():
-                if row.dropna().empty:
-                    continue
+def _build_organization(row, values, idx):
+    business_name = _as_str(values["business_name"])
+    main_website_url = _as_str(values["main_website_url"])
+    logo_url = _as_str(values["logo_url"])
+    short_description = _as_str(values["short_description"])
+    long_description = _as_str(values["long_description"])
 
-                question = _as_str(get_first(row, ["question", "q", "faq_question", "title"]))
-                answer = _as_str(get_first(row, ["answer", "a", "faq_answer", "response", "content"]))
-                slug = _as_str(get_first(row, ["slug", "faq_id", "id"]))
+    same_as = []
+    for k in PROFILE_COLUMNS:
+        v = row.get(k)
+        if _is_blank(v):
+            continue
+        vv = str(v).strip()
+        if k == "other_profiles" and "," in vv:
+            for part in [p.strip() for p in vv.split(",") if p.strip()]:
+                same_as.append(part)
+        else:
+            same_as.append(vv)
+
+    org = {k: v for k, v in row.items() if v is not None}
+
+    if business_name:
+        org["entity_name"] = business_name
+    if main_website_url:
+        org["website"] = main_website_url
+        org["url"] = main_website_url
+    if logo_url:
+        org["logo_url"] = logo_url
+    if short_description and "description" not in org:
+        org["description"] = short_description
+    if long_description:
+        org["about"] = long_description
+    if same_as:
+        org["sameAs"] = same_as
+
+    return "organization", org
+
+
+def _build_help_article(row, values, idx):
+    title = _as_str(values["title"])
+    slug = _as_str(values["slug"])
+    body = _as_str(values["body"])
+
+    if not slug:
+        slug = title or f"article-{idx+1}"
+    slug = slugify(slug)
+
+    return slug, {
+        "title": title,
+        "slug": slug,
+        "body": body,
+        "extra_frontmatter": {"date": _as_str(values["date"])},
+    }
 
-                if not question:
-                    question = f"Untitled FAQ {idx+1}"
-                if not slug:
-                    slug = slugify(question)
-                slug = slugify(slug)
 
-                if slug in seen_slugs:
-                    print(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
-                    continue
-                seen_slugs.add(slug)
+def _build_faq(row, values, idx):
+    question = _as_str(values["question"])
+    answer = _as_str(values["answer"])
+    slug = _as_str(values["slug"])
 
-                path = deterministic_path(output_dir, slug, ".json")
-                data = {"question": question, "answer": answer}
+    if not question:
+        question = f"Untitled FAQ {idx+1}"
+    if not slug:
+        slug = question
 
-                try:
-                    write_json(path, data)
-                    print(f"✅ Generated (overwrite): {path}")
-                    processed_count += 1
-                    processed_any = True
-                except Exception as e:
-                    print(f"❌ Failed to write {path}: {e}")
+    return slugify(slug), {"question": question, "answer": answer}
 
-            print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
-            continue
 
-        # ----------------------------
-        # SERVICES → JSON (supports Practice Areas too)
-        # ----------------------------
-        if canon == "services":
-            for idx, row in df.iterrows():
-                if row.dropna().empty:
-                    continue
-
-                service_name = _as_str(get_first(row, ["service_name", "practice_area", "practice_area_name", "name", "title"]))
-                slug = _as_str(get_first(row, ["slug", "service_id", "id"]))
-                description = _as_str(get_first(row, ["description", "service_description", "summary"]))
-                price_range = _as_str(get_first(row, ["price_range", "priceRange"]))
-                license_number = _as_str(get_first(row, ["license_number", "license"]))
-                bar_number = _as_str(get_first(row, ["bar_number", "barNumber"]))
-                npi_number = _as_str(get_first(row, ["npi_number", "npiNumber"]))
-                certification_body = _as_str(get_first(row, ["certification_body", "certification"]))
-
-                if not service_name:
-                    service_name = f"Service {idx+1}"
-                if not slug:
-                    slug = slugify(service_name)
-                slug = slugify(slug)
-
-                if slug in seen_slugs:
-                    print(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
-                    continue
-                seen_slugs.add(slug)
-
-                path = deterministic_path(output_dir, slug, ".json")
-
-                data = {
-                    "name": service_name,
-                    "description": description,
-                }
-                if price_range:
-                    data["priceRange"] = price_range
-                if license_number:
-                    data["license"] = license_number
-                if bar_number:
-                    data["barNumber"] = bar_number
-                if npi_number:
-                    data["npiNumber"] = npi_number
-                if certification_body:
-                    data["certification"] = certification_body
-
-                for col in df.columns:
-                    if col in data:
-                        continue
-                    v = row.get(col)
-                    if pd.isna(v):
-                        continue
-                    if hasattr(v, "item"):
-                        v = v.item()
-                    data[col] = v
+def _build_service(row, values, idx):
+    service_name = _as_str(values["service_name"])
+    slug = _as_str(values["slug"])
+    description = _as_str(values["description"])
+    price_range = _as_str(values["price_range"])
+    license_number = _as_str(values["license_number"])
+    bar_number = _as_str(values["bar_number"])
+    npi_number = _as_str(values["npi_number"])
+    certification_body = _as_str(values["certification_body"])
 
-                try:
-                    write_json(path, data)
-                    print(f"✅ Generated (overwrite): {path}")
-                    processed_count += 1
-                    processed_any = True
-                except Exception as e:
-                    print(f"❌ Failed to write {path}: {e}")
+    if not service_name:
+        service_name = f"Service {idx+1}"
+    if not slug:
+        slug = service_name
 
-            print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
+    data = {
+        "name": service_name,
+        "description": description,
+    }
+    if price_range:
+        data["priceRange"] = price_range
+    if license_number:
+        data["license"] = license_number
+    if bar_number:
+        data["barNumber"] = bar_number
+    if npi_number:
+        data["npiNumber"] = npi_number
+    if certification_body:
+        data["certification"] = certification_body
+
+    data.update({k: v for k, v in row.items() if v is not None and k not in data})
+    return slugify(slug), data
+
+
+def _build_team_member(row, values, idx):
+    member_name = _as_str(values["member_name"])
+    if not member_name:
+        fn = _as_str(values["first_name"])
+        ln = _as_str(values["last_name"])
+        member_name = " ".join([p for p in [fn, ln] if p]).strip()
+
+    slug = _as_str(values["slug"])
+    role = _as_str(values["role"])
+    bio = _as_str(values["bio"])
+    license_number = _as_str(values["license_number"])
+    bar_number = _as_str(values["bar_number"])
+    npi_number = _as_str(values["npi_number"])
+
+    if not member_name:
+        member_name = f"Member {idx+1}"
+    if not slug:
+        slug = member_name
+
+    data = {
+        "name": member_name,
+        "role": role,
+        "description": bio,
+    }
+    if license_number:
+        data["license"] = license_number
+    if bar_number:
+        data["barNumber"] = bar_number
+    if npi_number:
+        data["npiNumber"] = npi_number
+
+    data.update({k: v for k, v in row.items() if v is not None and k not in data})
+    return slugify(slug), data
+
+
+def _build_review(row, values, idx):
+    title = _as_str(values["title"])
+    body = _as_str(values["body"])
+    slug = _as_str(values["slug"])
+    rating = values["rating"]
+    date = _as_str(values["date"])
+
+    if not slug:
+        slug = title or f"review-{idx+1}"
+
+    data = {k: v for k, v in row.items() if v is not None}
+    if title:
+        data["review_title"] = title
+    if body:
+        data["review_body"] = body
+        if "quote" not in data:
+            data["quote"] = body
+    if not _is_blank(rating):
+        data["rating"] = rating
+    if date:
+        data["date"] = date
+
+    return slugify(slug), data
+
+
+def _build_location(row, values, idx):
+    name = _as_str(values["name"])
+    slug = _as_str(values["slug"])
+    if not slug:
+        slug = name or f"location-{idx+1}"
+
+    data = {k: v for k, v in row.items() if v is not None}
+
+    address_postal = _as_str(values["address_postal"])
+    open_hours = _as_str(values["open_hours"])
+    if address_postal and "address_postal_code" not in data:
+        data["address_postal_code"] = address_postal
+    if open_hours and "hours" not in data:
+        data["hours"] = open_hours
+    if name and "location_name" not in data:
+        data["location_name"] = name
+
+    return slugify(slug), data
+
+
+def _build_generic(row, values, idx):
+    """Press, awards, case studies, products, etc.: copy the row, slug from the first id-like column."""
+    id_field = _as_str(values["id_field"])
+    if not id_field:
+        id_field = f"item-{idx+1}"
+
+    data = {k: v for k, v in row.items() if v is not None}
+
+    if "title" in values:  # press
+        t = _as_str(values["title"])
+        if t and "title" not in data:
+            data["title"] = t
+
+    return slugify(id_field), data
+
+
+def _write_article(path: str, doc: dict):
+    write_md(path, **doc)
+
+
+@dataclass(frozen=True)
+class SheetSpec:
+    """How one canonical sheet becomes schema files."""
+    output_dir: str
+    fields: dict  # logical field -> candidate column names, resolved once per sheet
+    build: Callable  # (row, extracted field values, row number) -> (slug, payload)
+    ext: str = ".json"
+    writer: Callable = write_json  # (path, payload)
+    single: bool = False  # only the first usable row (organization)
+
+
+GENERIC_FIELDS = {
+    "id_field": [
+        "slug", "id",
+        "service_id", "product_id", "faq_id", "review_id", "location_id",
+        "case_id", "press_id",
+        "name", "title", "headline"
+    ],
+}
+
+SHEET_SPECS = {
+    "organization": SheetSpec(
+        output_dir="schemas/organization",
+        fields={
+            "business_name": ["business_name", "entity_name", "name", "company_name", "firm_name"],
+            "main_website_url": ["main_website_url", "website", "url"],
+            "logo_url": ["logo_url", "logo", "logoUrl"],
+            "short_description": ["short_description", "description", "tagline"],
+            "long_description": ["long_description", "about", "about_text"],
+        },
+        build=_build_organization,
+        single=True,
+    ),
+    "services": SheetSpec(
+        output_dir="schemas/services",
+        fields={
+            "service_name": ["service_name", "practice_area", "practice_area_name", "name", "title"],
+            "slug": ["slug", "service_id", "id"],
+            "description": ["description", "service_description", "summary"],
+            "price_range": ["price_range", "priceRange"],
+            "license_number": ["license_number", "license"],
+            "bar_number": ["bar_number", "barNumber"],
+            "npi_number": ["npi_number", "npiNumber"],
+            "certification_body": ["certification_body", "certification"],
+        },
+        build=_build_service,
+    ),
+    "products": SheetSpec(output_dir="schemas/products", fields=GENERIC_FIELDS, build=_build_generic),
+    "faqs": SheetSpec(
+        output_dir="schemas/faqs",
+        fields={
+            "question": ["question", "q", "faq_question", "title"],
+            "answer": ["answer", "a", "faq_answer", "response", "content"],
+            "slug": ["slug", "faq_id", "id"],
+        },
+        build=_build_faq,
+    ),
+    "help_articles": SheetSpec(
+        output_dir="schemas/help-articles",
+        fields={
+            "title": ["title", "article_title", "name", "headline"],
+            "slug": ["slug", "article_slug"],
+            "body": ["article_content", "article", "content", "body", "markdown"],
+            "date": ["date", "published_date", "publish_date"],
+        },
+        build=_build_help_article,
+        ext=".md",
+        writer=_write_article,
+    ),
+    "reviews": SheetSpec(
+        output_dir="schemas/reviews",
+        fields={
+            "title": ["review_title", "title", "headline"],
+            "body": ["review_body", "review", "quote", "testimonial", "content"],
+            "slug": ["slug", "review_id", "id"],
+            "rating": ["rating", "stars"],
+            "date": ["date", "review_date"],
+        },
+        build=_build_review,
+    ),
+    "locations": SheetSpec(
+        output_dir="schemas/locations",
+        fields={
+            "name": ["location_name", "name", "office_name", "title"],
+            "slug": ["slug", "location_id", "id"],
+            "address_postal": ["address_postal", "postal", "zip", "postal_code", "address_postal_code"],
+            "open_hours": ["open_hours", "hours", "opening_hours"],
+        },
+        build=_build_location,
+    ),
+    "team": SheetSpec(
+        output_dir="schemas/team",
+        fields={
+            "member_name": ["member_name", "lawyer_name", "attorney_name", "name", "full_name"],
+            "first_name": ["first_name", "firstname"],
+            "last_name": ["last_name", "lastname"],
+            "slug": ["slug", "member_id", "lawyer_id", "id"],
+            "role": ["role", "title", "position"],
+            "bio": ["bio", "description", "about", "summary"],
+            "license_number": ["license_number", "license"],
+            "bar_number": ["bar_number", "barNumber"],
+            "npi_number": ["npi_number", "npiNumber"],
+        },
+        build=_build_team_member,
+    ),
+    "awards": SheetSpec(output_dir="schemas/awards", fields=GENERIC_FIELDS, build=_build_generic),
+    "press": SheetSpec(
+        output_dir="schemas/press",
+        fields={**GENERIC_FIELDS, "title": ["title", "mention_title", "headline"]},
+        build=_build_generic,
+    ),
+    "case_studies": SheetSpec(output_dir="schemas/case-studies", fields=GENERIC_FIELDS, build=_build_generic),
+}
+
+
+def process_sheet(canon: str, columns: list[str], rows: list[tuple[int, dict]], verbose: bool = False) -> int:
+    """
+    One pipeline for every sheet type: resolve columns once, build (slug, payload)
+    per (already non-blank) row, de-duplicate slugs, then write in parallel.
+    Per-row messages are buffered and flushed to stdout in a single write.
+    Returns the number of files written.
+    """
+    spec = SHEET_SPECS[canon]
+    extract = compile_extractor(resolve_fields(columns, spec.fields))
+
+    if spec.single:
+        rows = rows[:1]
+
+    # Builders return slugified names, so the deterministic path is just prefix + slug + ext;
+    # join the directory once rather than calling os.path.join per row.
+    dir_prefix = os.path.join(spec.output_dir, "")
+    entries = []  # duplicate notices (str) and (path, write callable) tasks, in row order
+    seen = set()
+    for idx, row in rows:
+        slug, payload = spec.build(row, extract(row), idx)
+        # Skip duplicates within the same sheet (prevents overwriting + no -1 files)
+        if slug in seen:
+            entries.append(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
             continue
-
-        # ----------------------------
-        # TEAM → JSON (supports Lawyers sheet)
-        # ----------------------------
-        if canon == "team":
-            for idx, row in df.iterrows():
-                if row.dropna().empty:
-                    continue
-
-                member_name = _as_str(get_first(row, ["member_name", "lawyer_name", "attorney_name", "name", "full_name"]))
-                if not member_name:
-                    fn = _as_str(get_first(row, ["first_name", "firstname"]))
-                    ln = _as_str(get_first(row, ["last_name", "lastname"]))
-                    member_name = " ".join([p for p in [fn, ln] if p]).strip()
-
-                slug = _as_str(get_first(row, ["slug", "member_id", "lawyer_id", "id"]))
-                role = _as_str(get_first(row, ["role", "title", "position"]))
-                bio = _as_str(get_first(row, ["bio", "description", "about", "summary"]))
-                license_number = _as_str(get_first(row, ["license_number", "license"]))
-                bar_number = _as_str(get_first(row, ["bar_number", "barNumber"]))
-                npi_number = _as_str(get_first(row, ["npi_number", "npiNumber"]))
-
-                if not member_name:
-                    member_name = f"Member {idx+1}"
-                if not slug:
-                    slug = slugify(member_name)
-                slug = slugify(slug)
-
-                if slug in seen_slugs:
-                    print(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
-                    continue
-                seen_slugs.add(slug)
-
-                path = deterministic_path(output_dir, slug, ".json")
-
-                data = {
-                    "name": member_name,
-                    "role": role,
-                    "description": bio,
-                }
-
-                if license_number:
-                    data["license"] = license_number
-                if bar_number:
-                    data["barNumber"] = bar_number
-                if npi_number:
-                    data["npiNumber"] = npi_number
-
-                for col in df.columns:
-                    if col in data:
-                        continue
-                    v = row.get(col)
-                    if pd.isna(v):
-                        continue
-                    if hasattr(v, "item"):
-                        v = v.item()
-                    data[col] = v
-
-                try:
-                    write_json(path, data)
-                    print(f"✅ Generated (overwrite): {path}")
-                    processed_count += 1
-                    processed_any = True
-                except Exception as e:
-                    print(f"❌ Failed to write {path}: {e}")
-
-            print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
+        seen.add(slug)
+        path = dir_prefix + slug + spec.ext
+        entries.append((path, functools.partial(spec.writer, path, payload)))
+
+    errors = iter(write_files([e for e in entries if not isinstance(e, str)]))
+    log = []
+    written = 0
+    for entry in entries:
+        if isinstance(entry, str):
+            log.append(entry)
             continue
+        path, _ = entry
+        err = next(errors)
+        if err is None:
+            if verbose:
+                log.append(f"✅ Generated (overwrite): {path}")
+            written += 1
+        else:
+            log.append(f"❌ Failed to write {path}: {err}")
+    if log:
+        sys.stdout.write("\n".join(log) + "\n")
+    return written
+
+
+# Sheet aliases (supports both old and new/legal names)
+SHEET_ALIASES = {
+    "organization": [
+        "entity_info",
+        "Business Info",
+        "Business information",
+        "Organization",
+        "Company",
+        "Firm Info",
+    ],
+    "services": [
+        "Services",
+        "Practice Areas",
+        "Practice areas",
+        "Service Areas",
+        "Medical Specialties",
+    ],
+    "products": [
+        "Products",
+    ],
+    "faqs": [
+        "FAQs",
+        "FAQ",
+    ],
+    "help_articles": [
+        "Help Articles",
+        "Help articles",
+        "Articles",
+        "Guides",
+        "Blog",
+    ],
+    "reviews": [
+        "Reviews",
+        "Testimonials",
+    ],
+    "locations": [
+        "Locations",
+        "Offices",
+    ],
+    "team": [
+        "Team",
+        "Lawyers",
+        "Attorneys",
+        "Providers",
+        "Staff",
+    ],
+    "awards": [
+        "Awards & Certifications",
+        "Awards",
+        "Certifications",
+        "Accreditations",
+        "Licenses",
+        "Awards, Certifications, Accreditations",
+    ],
+    "press": [
+        "Press/News Mentions",
+        "Media Mentions",
+        "Press",
+        "News",
+        "Media",
+    ],
+    "case_studies": [
+        "Case Studies",
+        "Case studies",
+        "Matters",
+        "Results",
+    ],
+}
+
+
+def norm_sheet(s: str) -> str:
+    """Case/whitespace-insensitive sheet name key ("Help  Articles " -> "help articles")."""
+    return " ".join(str(s).lower().split())
+
+
+# Built once at import: normalized alias -> canonical sheet key
+ALIAS_LOOKUP = {norm_sheet(a): canon for canon, aliases in SHEET_ALIASES.items() for a in aliases}
+
+
+def main(input_file="templates/AI-Visibility-Master-Template.xlsx", clean=False, verbose=False):
+    print(f"📂 Opening Excel file: {input_file}")
 
-        # ----------------------------
-        # REVIEWS → JSON (normalize review -> review_body)
-        # ----------------------------
-        if canon == "reviews":
-            for idx, row in df.iterrows():
-                if row.dropna().empty:
-                    continue
-
-                title = _as_str(get_first(row, ["review_title", "title", "headline"]))
-                body = _as_str(get_first(row, ["review_body", "review", "quote", "testimonial", "content"]))
-                slug = _as_str(get_first(row, ["slug", "review_id", "id"]))
-                rating = get_first(row, ["rating", "stars"])
-                date = _as_str(get_first(row, ["date", "review_date"]))
-
-                if not slug:
-                    slug = slugify(title) if title else f"review-{idx+1}"
-                slug = slugify(slug)
-
-                if slug in seen_slugs:
-                    print(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
-                    continue
-                seen_slugs.add(slug)
-
-                path = deterministic_path(output_dir, slug, ".json")
-
-                data = {}
-                for col in df.columns:
-                    v = row.get(col)
-                    if pd.isna(v):
-                        continue
-                    if hasattr(v, "item"):
-                        v = v.item()
-                    data[col] = v
-
-                if title:
-                    data["review_title"] = title
-                if body:
-                    data["review_body"] = body
-                    if "quote" not in data:
-                        data["quote"] = body
-                if not _is_blank(rating):
-                    data["rating"] = rating
-                if date:
-                    data["date"] = date
+    if not os.path.exists(input_file):
+        print(f"❌ FATAL: Excel file not found at {input_file}")
+        sys.exit(1)
+    else:
+        print(f"✅ Excel file confirmed at: {input_file}")
 
-                try:
-                    write_json(path, data)
-                    print(f"✅ Generated (overwrite): {path}")
-                    processed_count += 1
-                    processed_any = True
-                except Exception as e:
-                    print(f"❌ Failed to write {path}: {e}")
+    try:
+        sheet_names, read_sheet = open_workbook(input_file)
+        print(f"📄 Available sheets in workbook: {sheet_names}")
+    except Exception as e:
+        print(f"❌ Failed to load Excel file: {e}")
+        sys.exit(1)
 
-            print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
-            continue
+    # Canonical sheet keys -> output dirs
+    canonical_output = {canon: spec.output_dir for canon, spec in SHEET_SPECS.items()}
 
-        # ----------------------------
-        # LOCATIONS → JSON (normalize postal/hours)
-        # ----------------------------
-        if canon == "locations":
-            for idx, row in df.iterrows():
-                if row.dropna().empty:
-                    continue
-
-                name = _as_str(get_first(row, ["location_name", "name", "office_name", "title"]))
-                slug = _as_str(get_first(row, ["slug", "location_id", "id"]))
-                if not slug:
-                    slug = slugify(name) if name else f"location-{idx+1}"
-                slug = slugify(slug)
-
-                if slug in seen_slugs:
-                    print(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
-                    continue
-                seen_slugs.add(slug)
-
-                path = deterministic_path(output_dir, slug, ".json")
-
-                data = {}
-                for col in df.columns:
-                    v = row.get(col)
-                    if pd.isna(v):
-                        continue
-                    if hasattr(v, "item"):
-                        v = v.item()
-                    data[col] = v
-
-                address_postal = _as_str(get_first(row, ["address_postal", "postal", "zip", "postal_code", "address_postal_code"]))
-                open_hours = _as_str(get_first(row, ["open_hours", "hours", "opening_hours"]))
-                if address_postal and "address_postal_code" not in data:
-                    data["address_postal_code"] = address_postal
-                if open_hours and "hours" not in data:
-                    data["hours"] = open_hours
-                if name and "location_name" not in data:
-                    data["location_name"] = name
+    # Create every output dir once instead of a makedirs() per written file.
+    for d in set(canonical_output.values()):
+        os.makedirs(d, exist_ok=True)
 
-                try:
-                    write_json(path, data)
-                    print(f"✅ Generated (overwrite): {path}")
-                    processed_count += 1
-                    processed_any = True
-                except Exception as e:
-                    print(f"❌ Failed to write {path}: {e}")
+    if clean:
+        clean_output_dirs(canonical_output)
 
-            print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
-            continue
+    processed_any = False
 
-        # ----------------------------
-        # GENERIC HANDLER (press, awards, case studies, products, etc.)
-        # ----------------------------
-        for idx, row in df.iterrows():
-            if row.dropna().empty:
-                continue
+    for actual_sheet in sheet_names:
+        canon = ALIAS_LOOKUP.get(norm_sheet(actual_sheet))
+        if not canon:
+            print(f"⚠️ Skipping unsupported sheet: {actual_sheet}")
+            continue
 
-            id_field = _as_str(get_first(row, [
-                "slug", "id",
-                "service_id", "product_id", "faq_id", "review_id", "location_id",
-                "case_id", "press_id",
-                "name", "title", "headline"
-            ]))
-            if not id_field:
-                id_field = f"item-{idx+1}"
-            slug = slugify(id_field)
-
-            if slug in seen_slugs:
-                print(f"↩️ Skipping duplicate slug in sheet (kept first): {slug}")
-                continue
-            seen_slugs.add(slug)
+        output_dir = canonical_output[canon]
 
-            path = deterministic_path(output_dir, slug, ".json")
+        print(f"\n📄 Processing sheet: {actual_sheet}  →  {canon}  →  {output_dir}")
 
-            data = {}
-            for col in df.columns:
-                v = row.get(col)
-                if pd.isna(v):
-                    continue
-                if hasattr(v, "item"):
-                    v = v.item()
-                data[col] = v
+        columns, rows = read_sheet(actual_sheet)
 
-            if canon == "press":
-                t = _as_str(get_first(row, ["title", "mention_title", "headline"]))
-                if t and "title" not in data:
-                    data["title"] = t
+        if not rows:
+            print(f"⚠️ Sheet '{actual_sheet}' is empty — skipping")
+            continue
 
-            try:
-                write_json(path, data)
-                print(f"✅ Generated (overwrite): {path}")
-                processed_count += 1
-                processed_any = True
-            except Exception as e:
-                print(f"❌ Failed to write {path}: {e}")
+        print(f"🧹 Cleaned column names: {columns}")
 
+        processed_count = process_sheet(canon, columns, rows, verbose)
+        processed_any = processed_any or processed_count > 0
         print(f"📊 Total processed in '{actual_sheet}': {processed_count} items")
 
     if not processed_any:
@@ -705,5 +873,7 @@ if __name__ == "__main__":
                         help="Path to input Excel file")
     parser.add_argument("--clean", action="store_true",
                         help="Delete previously generated .json/.md files under known schemas/* folders before writing")
+    parser.add_argument("--verbose", action="store_true",
+                        help="List every generated file (default: one summary line per sheet)")
     args = parser.parse_args()
-    main(args.input, clean=args.clean)
+    main(args.input, clean=args.clean, verbose=args.verbose)